@@ -1,5 +1,67 @@
+import importlib
+import os
+import time
+
 import streamlit as st
 import pandas as pd
+from streamlit.logger import get_logger
+
+DEFAULT_DATA_PATH = 'pharma_data_aggregated.csv'
+# Set by run.py so render timings can be measured from process launch.
+LAUNCHED_AT_ENV = 'PHARMA_DASH_LAUNCHED_AT'
+
+# Follows `--logger.level`, so the timings show up in the server's terminal.
+logger = get_logger(__name__)
+
+_first_render_logged = False
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _read_csv(path, mtime):
+    # `mtime` is only part of the cache key: replacing the file on disk
+    # invalidates the cached frame.
+    df = pd.read_csv(path)
+    if 'month_year' in df.columns:
+        df['month_year'] = pd.to_datetime(df['month_year'], errors='coerce')
+    return df
+
+
+def compute_overview(df):
+    """Aggregates shown on the home page."""
+    overview = {
+        'total_revenue': df['revenue'].sum(),
+        'total_products': df['product_code'].nunique(),
+        'total_months': df['month_year'].nunique() if 'month_year' in df.columns else 'N/A',
+        'avg_margin': df['margin_pct'].mean(),
+        'monthly_revenue': None,
+    }
+    if 'month_year' in df.columns:
+        overview['monthly_revenue'] = df.groupby('month_year')['revenue'].sum().reset_index()
+    overview['top_products_revenue'] = df.groupby(['product_code', 'product_name']).agg({
+        'revenue': 'sum',
+        'quantity': 'sum',
+        'margin_pct': 'mean'
+    }).sort_values('revenue', ascending=False).head(10)
+    overview['product_summary'] = df.groupby('product_code').agg({
+        'quantity': 'sum',
+        'revenue': 'sum',
+        'margin_pct': 'mean',
+        'product_name': 'first'
+    }).reset_index().head(50)
+    return overview
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _default_overview(path, mtime):
+    return compute_overview(_read_csv(path, mtime))
+
+
+def _default_mtime():
+    try:
+        return os.path.getmtime(DEFAULT_DATA_PATH)
+    except FileNotFoundError:
+        return None
+
 
 def load_data():
     if 'uploaded_df' in st.session_state:
@@ -8,11 +70,53 @@ def load_data():
             df['month_year'] = pd.to_datetime(df['month_year'], errors='coerce')
         return df
     else:
-        try:
-            df = pd.read_csv('pharma_data_aggregated.csv')
-            if 'month_year' in df.columns:
-                df['month_year'] = pd.to_datetime(df['month_year'], errors='coerce')
-            return df
-        except FileNotFoundError:
+        mtime = _default_mtime()
+        if mtime is None:
             # No fallback file found — just return None gracefully
             return None
+        return _read_csv(DEFAULT_DATA_PATH, mtime)
+
+
+def load_overview():
+    """Home page aggregates, cached for the default dataset; None without data."""
+    if 'uploaded_df' in st.session_state:
+        return compute_overview(load_data())
+    mtime = _default_mtime()
+    if mtime is None:
+        return None
+    return _default_overview(DEFAULT_DATA_PATH, mtime)
+
+
+def warm_default_cache():
+    """Fill the default dataset and overview caches; False if there is no CSV."""
+    mtime = _default_mtime()
+    if mtime is None:
+        return False
+    _read_csv(DEFAULT_DATA_PATH, mtime)
+    _default_overview(DEFAULT_DATA_PATH, mtime)
+    return True
+
+
+def get_px():
+    """Import plotly.express on first use instead of at page import time."""
+    return importlib.import_module('plotly.express')
+
+
+def begin_render():
+    st.session_state['_render_started'] = time.perf_counter()
+
+
+def end_render(page):
+    """Log this run of `page` at DEBUG, and the process's time to first render once."""
+    global _first_render_logged
+    started = st.session_state.pop('_render_started', None)
+    if started is not None:
+        logger.debug("%s rendered in %.0f ms", page, (time.perf_counter() - started) * 1000)
+    if not _first_render_logged:
+        _first_render_logged = True
+        # Only run.py records the launch time; under plain `streamlit run`
+        # there is no cold-start figure to report.
+        launched_at = os.environ.get(LAUNCHED_AT_ENV)
+        if launched_at is not None:
+            logger.info("Time to first render: %.0f ms after launch",
+                        (time.time() - float(launched_at)) * 1000)
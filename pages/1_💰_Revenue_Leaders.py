@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from data_loader import load_data  # Import your centralized load_data function
+from data_loader import load_data, get_px, begin_render, end_render
 
 st.set_page_config(page_title="Revenue Leaders", page_icon="💰", layout="wide")
+begin_render()
 
 # Load data
 df = load_data()
@@ -29,6 +28,7 @@ st.dataframe(display_df, use_container_width=True)
 
 # Chart
 top_10_revenue = revenue_leaders.head(10)
+px = get_px()
 fig_bar = px.bar(x=top_10_revenue.index.get_level_values(1)[:10], 
                  y=top_10_revenue['revenue'].values[:10],
                  title="Top 10 Revenue Generators",
@@ -50,4 +50,6 @@ with col2:
 with col3:
     st.metric("Monthly Average", f"${top_monthly:,.0f}")
 
-st.markdown("**💡 Recommendation:** Focus your initial inventory investment on the top 10-15 products listed above. These generate the most revenue and should be your priority for stocking.")
\ No newline at end of file
+st.markdown("**💡 Recommendation:** Focus your initial inventory investment on the top 10-15 products listed above. These generate the most revenue and should be your priority for stocking.")
+
+end_render("Revenue Leaders")
@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from data_loader import load_data  # Import your centralized load_data function
+from data_loader import load_data, get_px, begin_render, end_render
 
 st.set_page_config(page_title="Volume Leaders", page_icon="📦", layout="wide")
+begin_render()
 
 # Load data
 df = load_data()
@@ -28,6 +27,7 @@ st.dataframe(display_df, use_container_width=True)
 
 # Chart
 top_10_volume = volume_leaders.head(10)
+px = get_px()
 fig_bar = px.bar(x=top_10_volume.index.get_level_values(1)[:10], 
                  y=top_10_volume['quantity'].values[:10],
                  title="Top 10 Volume Sellers",
@@ -51,4 +51,6 @@ with col2:
 with col3:
     st.metric("Monthly Average", f"{top_monthly_qty:,.1f} units")
 
-st.markdown("**💡 Recommendation:** These high-volume products ensure fast inventory turnover. Stock these generously to avoid stockouts and maintain consistent customer satisfaction.")
\ No newline at end of file
+st.markdown("**💡 Recommendation:** These high-volume products ensure fast inventory turnover. Stock these generously to avoid stockouts and maintain consistent customer satisfaction.")
+
+end_render("Volume Leaders")
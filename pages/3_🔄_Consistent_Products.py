@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from data_loader import load_data  # Import your centralized load_data function
+from data_loader import load_data, get_px, begin_render, end_render
 
 st.set_page_config(page_title="Consistent Products", page_icon="🔄", layout="wide")
+begin_render()
 
 # Load data
 df = load_data()
@@ -30,6 +29,7 @@ display_df.columns = ['Months Present', 'Consistency %', 'Avg Monthly Qty', 'Avg
 st.dataframe(display_df, use_container_width=True)
 
 # Consistency chart
+px = get_px()
 fig_scatter = px.scatter(most_consistent, x='months_present', y='total_revenue',
                        size='avg_monthly_qty', color='avg_margin',
                        hover_data=['consistency_pct'],
@@ -52,4 +52,6 @@ with col2:
 with col3:
     st.metric("100% Consistent Products", f"{avg_products_100_percent}")
 
-st.markdown("**💡 Recommendation:** These products sell consistently every month, making them low-risk investments. Perfect for maintaining steady cash flow and customer satisfaction.")
\ No newline at end of file
+st.markdown("**💡 Recommendation:** These products sell consistently every month, making them low-risk investments. Perfect for maintaining steady cash flow and customer satisfaction.")
+
+end_render("Consistent Products")
@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from data_loader import load_data  # Import your centralized load_data function
+from data_loader import load_data, get_px, begin_render, end_render
 
 st.set_page_config(page_title="High Margins", page_icon="📈", layout="wide")
+begin_render()
 
 # Load data
 df = load_data()
@@ -26,6 +25,7 @@ display_df.columns = ['Avg Margin %', 'Total Revenue', 'Avg Monthly Revenue', 'T
 st.dataframe(display_df, use_container_width=True)
 
 # Margin chart
+px = get_px()
 fig_bar = px.bar(x=high_margin.index.get_level_values(1), 
                  y=high_margin['margin_pct'].values,
                  title="Highest Profit Margin Products",
@@ -56,4 +56,6 @@ with col2:
 with col3:
     st.metric("Average Margin (Top 15)", f"{avg_margin:.1f}%")
 
-st.markdown("**💡 Recommendation:** Focus on these high-margin products for maximum profitability per sale. Even with lower volumes, they can significantly boost your bottom line.")
\ No newline at end of file
+st.markdown("**💡 Recommendation:** Focus on these high-margin products for maximum profitability per sale. Even with lower volumes, they can significantly boost your bottom line.")
+
+end_render("High Margins")
@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from data_loader import load_data  # Import your centralized load_data function
+from data_loader import load_data, get_px, begin_render, end_render
 
 st.set_page_config(page_title="Starter Pack", page_icon="🎯", layout="wide")
+begin_render()
 
 # Load data
 df = load_data()
@@ -168,6 +167,7 @@ score_long['Score Component'] = score_long['Score Component'].replace({
     'score_affordability': 'Affordability'
 })
 
+px = get_px()
 fig_score_breakdown = px.bar(
     score_long,
     x='Score Contribution',
@@ -255,3 +255,5 @@ st.success(f"""
 - Projected ROI: {((total_monthly_revenue_est - total_investment_estimate) / total_investment_estimate * 100):.1f}%
 """)
 st.markdown("**💡 Recommendation:** Start with the top products from this list based on your available capital.")
+
+end_render("Starter Pack")
@@ -1,9 +1,9 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px 
-from data_loader import load_data  # Import your centralized load_data function
+from data_loader import load_data, get_px, begin_render, end_render
 
 st.set_page_config(page_title="Sales Trends", page_icon="📊", layout="wide")
+begin_render()
 
 # Load data
 df = load_data()
@@ -21,6 +21,7 @@ monthly_data['month_year'] = pd.to_datetime(monthly_data['month_year'])
 monthly_data['growth_rate'] = monthly_data['revenue'].pct_change() * 100
 
 # Revenue trend
+px = get_px()
 fig_line = px.line(monthly_data, x='month_year', y='revenue',
                   title="Monthly Revenue Trend",
                   labels={'month_year': 'Month', 'revenue': 'Revenue ($)'})
@@ -73,4 +74,6 @@ with col2:
 with col3:
     st.metric("Avg Monthly Growth", f"{avg_growth:.1f}%")
 
-st.markdown("**💡 Recommendation:** Use these trends to plan inventory levels seasonally and identify the best times for promotions or new product launches.")
\ No newline at end of file
+st.markdown("**💡 Recommendation:** Use these trends to plan inventory levels seasonally and identify the best times for promotions or new product launches.")
+
+end_render("Trends")
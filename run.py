@@ -0,0 +1,44 @@
+"""Start the dashboard with its imports and default data already warm.
+
+    python run.py [streamlit run options]
+
+Equivalent to `streamlit run 🏥_Pharmacy_Analysis_Home.py`, except that
+pandas, plotly.express and data_loader are imported, and the default dataset
+and its home page aggregates are cached, before the server starts accepting
+connections. Page scripts run in this same process, so the first visitor
+doesn't wait on any of it.
+"""
+import os
+import sys
+import time
+
+# Taken before the heavy imports below so they count towards time to first render.
+LAUNCHED_AT = time.time()
+
+from streamlit.web import cli as stcli
+
+import data_loader
+
+HOME_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '🏥_Pharmacy_Analysis_Home.py')
+
+
+def warm_up():
+    start = time.perf_counter()
+    try:
+        data_loader.get_px()
+    except Exception:
+        data_loader.logger.exception("Warm-up failed; charts will import plotly on first use")
+    try:
+        if not data_loader.warm_default_cache():
+            data_loader.logger.info("No %s found; skipping data warm-up", data_loader.DEFAULT_DATA_PATH)
+    except Exception:
+        data_loader.logger.exception("Warm-up failed; the default dataset will load on first request")
+    data_loader.logger.info("Warm-up finished in %.0f ms", (time.perf_counter() - start) * 1000)
+
+
+if __name__ == '__main__':
+    # Overwrite rather than setdefault: an inherited value would be a stale launch time.
+    os.environ[data_loader.LAUNCHED_AT_ENV] = str(LAUNCHED_AT)
+    warm_up()
+    sys.argv = ['streamlit', 'run', HOME_PAGE] + sys.argv[1:]
+    sys.exit(stcli.main())
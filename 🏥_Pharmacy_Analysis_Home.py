@@ -1,13 +1,13 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from data_loader import load_data  # Import your centralized load_data function
+from data_loader import load_overview, get_px, begin_render, end_render
 
 st.set_page_config(
     page_title="Pharmacy Startup Analysis Dashboard",
     page_icon="🏥",
     layout="wide"
 )
+begin_render()
 
 st.title("🏥 Pharmacy Startup Analysis Dashboard")
 st.markdown("**Data-driven insights for your pharmacy startup - What to stock first to maximize revenue**")
@@ -22,14 +22,14 @@ if uploaded_file is not None:
     st.session_state['uploaded_df'] = df
     st.success("File uploaded and data loaded successfully!")
 
-# Load data via centralized function
-df = load_data()
+# Load the overview aggregates; the full frame is only read for uploads
+overview = load_overview()
 
-if df is not None:
-    total_revenue = df['revenue'].sum()
-    total_products = df['product_code'].nunique()
-    total_months = df['month_year'].nunique() if 'month_year' in df.columns else 'N/A'
-    avg_margin = df['margin_pct'].mean()
+if overview is not None:
+    total_revenue = overview['total_revenue']
+    total_products = overview['total_products']
+    total_months = overview['total_months']
+    avg_margin = overview['avg_margin']
 
     st.header("📈 Business Overview")
     col1, col2, col3, col4 = st.columns(4)
@@ -43,8 +43,9 @@ if df is not None:
         st.metric("Avg Profit Margin", f"{avg_margin:.1f}%")
 
     st.subheader("📅 Monthly Revenue Trends")
-    if 'month_year' in df.columns:
-        monthly_revenue = df.groupby('month_year')['revenue'].sum().reset_index()
+    px = get_px()
+    if overview['monthly_revenue'] is not None:
+        monthly_revenue = overview['monthly_revenue']
         fig_revenue = px.line(monthly_revenue, x='month_year', y='revenue',
                               title="Monthly Revenue Trend",
                               labels={'month_year': 'Month', 'revenue': 'Revenue ($)'})
@@ -56,11 +57,7 @@ if df is not None:
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("📊 Top Products by Revenue")
-        top_products_revenue = df.groupby(['product_code', 'product_name']).agg({
-            'revenue': 'sum',
-            'quantity': 'sum',
-            'margin_pct': 'mean'
-        }).sort_values('revenue', ascending=False).head(10)
+        top_products_revenue = overview['top_products_revenue']
 
         fig_bar = px.bar(x=top_products_revenue.index.get_level_values(1),
                          y=top_products_revenue['revenue'],
@@ -71,12 +68,7 @@ if df is not None:
 
     with col2:
         st.subheader("📊 Quantity vs Revenue")
-        product_summary = df.groupby('product_code').agg({
-            'quantity': 'sum',
-            'revenue': 'sum',
-            'margin_pct': 'mean',
-            'product_name': 'first'
-        }).reset_index().head(50)
+        product_summary = overview['product_summary']
 
         fig_scatter = px.scatter(product_summary, x='quantity', y='revenue',
                                  color='margin_pct',
@@ -93,4 +85,6 @@ if df is not None:
     st.markdown("**💡 Dashboard built for pharmacy startup analysis | Data-driven inventory decisions**")
 
 else:
-    st.info("No data available yet. Please upload a CSV file above to get started.")
\ No newline at end of file
+    st.info("No data available yet. Please upload a CSV file above to get started.")
+
+end_render("Home")